@@ -1,5 +1,5 @@
 import os
-import re
+from urllib.parse import urlsplit
 
 MANAGEMENT_API_KEY = os.getenv("ARCANNA_MANAGEMENT_API_KEY")
 ARCANNA_HOST = os.getenv("ARCANNA_HOST")
@@ -12,28 +12,45 @@ ARCANNA_EXPOSER_DEFAULT_PORT = "9666"
 ARCANNA_AGENTS_DEFAULT_PORT = "9888"
 ARCANNA_RAG_DEFAULT_PORT = "5356"
 
-if ARCANNA_AGENTS_HOST is None:
-    base_url = re.match(r'https?://[^:]+', ARCANNA_HOST).group()
-    ARCANNA_AGENTS_HOST = base_url + ":" + ARCANNA_AGENTS_DEFAULT_PORT
+SUPPORTED_TRANSPORT_MODES = frozenset({"stdio", "sse"})
 
-if ARCANNA_RAG_HOST is None:
-    base_url = re.match(r'https?://[^:]+', ARCANNA_HOST).group()
-    ARCANNA_RAG_HOST = base_url + ":" + ARCANNA_RAG_DEFAULT_PORT
+
+def _get_base_url(host_url: str) -> str:
+    """
+    scheme://host[:port][/path] -> scheme://host
+    """
+    split_url = urlsplit(host_url)
+    hostname = split_url.hostname
+    if hostname is None:
+        raise Exception(f"ARCANNA_HOST must include a scheme, e.g. https://{host_url}")
+    if ":" in hostname:
+        hostname = f"[{hostname}]"
+    return f"{split_url.scheme}://{hostname}"
+
+
+if ARCANNA_HOST:
+    base_url = _get_base_url(ARCANNA_HOST)
+
+    if ARCANNA_AGENTS_HOST is None:
+        ARCANNA_AGENTS_HOST = base_url + ":" + ARCANNA_AGENTS_DEFAULT_PORT
+
+    if ARCANNA_RAG_HOST is None:
+        ARCANNA_RAG_HOST = base_url + ":" + ARCANNA_RAG_DEFAULT_PORT
 
 
 def validate_environment_variables():
     if MANAGEMENT_API_KEY is None:
         raise Exception("ARCANNA_MANAGEMENT_API_KEY env variable not found")
 
-    if ARCANNA_HOST is None:
+    if not ARCANNA_HOST:
         raise Exception("ARCANNA_HOST env variable not found.")
 
     if ARCANNA_AGENTS_HOST is None:
         raise Exception("ARCANNA_AGENTS_HOST env variable not found.")
 
     if ARCANNA_RAG_HOST is None:
-        raise Exception("ARCANNA_AGENTS_HOST env variable not found.")
+        raise Exception("ARCANNA_RAG_HOST env variable not found.")
 
-    if TRANSPORT_MODE not in ["stdio", "sse"]:
+    if TRANSPORT_MODE not in SUPPORTED_TRANSPORT_MODES:
         raise Exception(f"TRANSPORT_MODE {TRANSPORT_MODE} not supported.")
 
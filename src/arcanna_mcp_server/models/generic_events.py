@@ -4,7 +4,7 @@ from pydantic import BaseModel, Field
 
 class Filter(BaseModel):
     field: str
-    operator: Literal["is", "is not", "is one of", "is not one of", "starts with", "not starts with", "contains", "not contains", "exists", "not exists", "lt", "lte", "gte", "gte"]
+    operator: Literal["is", "is not", "is one of", "is not one of", "starts with", "not starts with", "contains", "not contains", "exists", "not exists", "lt", "lte", "gt", "gte"]
     value: Optional[Any] = None
 
 
@@ -23,6 +23,22 @@ class EventsModelResponse(BaseModel):
     total_count: int
 
 
+class EventFeedback(BaseModel):
+    event_id: Union[str, int] = Field(description="Unique identifier of the event you want to provide feedback for.")
+    label: str = Field(description="Decision label to be applied for the event, for example Escalate or Drop.")
+    storage_name: Optional[str] = Field(default=None, description="Storage name to be used for feedback."
+                                                                  " Use only if the job have multiple storages defined.")
+
+
+class EventsQuery(BaseModel):
+    job_ids: Optional[Union[List[int], int]] = Field(default=None, description="Job IDs to filter on.")
+    job_titles: Optional[Union[List[str], str]] = Field(default=None, description="Job titles to filter on.")
+    query_body: Optional[Dict[str, Any]] = Field(default=None, description="Elasticsearch query body, same format as"
+                                                                          " the query_body of query_arcanna_events.")
+    decision_points_only: Optional[bool] = Field(default=False, description="If set to true, only decision points will"
+                                                                            " be included in the events response.")
+
+
 class TransferEventResponse(BaseModel):
     event_id: Optional[Union[str, int]] = Field(default=None)
     job_id: Optional[int] = Field(default=None)
@@ -1,15 +1,26 @@
-from dotenv import load_dotenv
-load_dotenv(verbose=True)
+import os
+
+if os.getenv("ARCANNA_LOAD_DOTENV") == "1":
+    from dotenv import load_dotenv
+    load_dotenv()
 
 from mcp.server import FastMCP
 
 from arcanna_mcp_server.environment import TRANSPORT_MODE, validate_environment_variables
+
+# Validate before the tool modules build their endpoint URLs from the configured hosts
+validate_environment_variables()
+
 from arcanna_mcp_server.prompts import attach_prompts
 from arcanna_mcp_server.tools import attach_tools
-import os
+from arcanna_mcp_server.utils.client_session import client_session_lifespan
 
 
-mcp = FastMCP("arcanna_mcp-server", port=int(os.getenv("PORT") or 8000))
+mcp = FastMCP(
+    "arcanna_mcp-server",
+    port=int(os.getenv("PORT") or 8000),
+    lifespan=client_session_lifespan
+)
 
 attach_tools(mcp)
 attach_prompts(mcp)
@@ -18,7 +29,6 @@ attach_prompts(mcp)
 def main():
     # Initialize and run the server
     print(f"Started server with transport mode {TRANSPORT_MODE}")
-    validate_environment_variables()
     mcp.run(transport=TRANSPORT_MODE)
 
 
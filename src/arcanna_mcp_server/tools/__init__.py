@@ -1,27 +1,27 @@
-import arcanna_mcp_server.tools.resources
-import arcanna_mcp_server.tools.resources_management
 from mcp.server import FastMCP
-import arcanna_mcp_server.tools.jobs
-import arcanna_mcp_server.tools.health_check
-import arcanna_mcp_server.tools.custom_code_block
-import arcanna_mcp_server.tools.generic_events
-import arcanna_mcp_server.tools.metrics
-import arcanna_mcp_server.tools.agentic
+from arcanna_mcp_server.tools import (
+    agentic, custom_code_block, generic_events, health_check, jobs, metrics, resources, resources_management
+)
 from arcanna_mcp_server.utils.tool_scopes import filter_by_scope
 
 
+TOOL_MODULES = (
+    jobs,
+    health_check,
+    custom_code_block,
+    resources,
+    resources_management,
+    generic_events,
+    metrics,
+    agentic,
+)
+
+
 def attach_tools(mcp_server: FastMCP):
-    modules = [
-        arcanna_mcp_server.tools.jobs,
-        arcanna_mcp_server.tools.health_check,
-        arcanna_mcp_server.tools.custom_code_block,
-        arcanna_mcp_server.tools.resources,
-        arcanna_mcp_server.tools.resources_management,
-        arcanna_mcp_server.tools.generic_events,
-        arcanna_mcp_server.tools.metrics,
-        arcanna_mcp_server.tools.agentic,
-    ]
-    for module in modules:
-        filtered_modules_tools = filter_by_scope(module.export_tools())
-        for tool_fn in filtered_modules_tools:
-            mcp_server.add_tool(tool_fn)
+    modules_tools = []
+    for module in TOOL_MODULES:
+        modules_tools.extend(module.export_tools())
+
+    # A single filter_by_scope call fetches the API key scope once instead of once per module
+    for tool_fn in filter_by_scope(modules_tools):
+        mcp_server.add_tool(tool_fn)
@@ -1,23 +1,30 @@
+import asyncio
+import time
 from typing import Annotated, Callable, List, Optional, Union
 
 from pydantic import Field
 
 from arcanna_mcp_server.constants import LIST_WORKFLOWS_URL, RUN_WORKFLOW_BY_ID_URL, UPSERT_WORKFLOWS_URL, \
     TEST_RUN_WORKFLOW_BY_ID_URL, TOOL_DISCOVERY_URL, LLM_PROVIDERS_DISCOVERY_URL, GET_WORKFLOW_BY_ID_URL
-from arcanna_mcp_server.environment import MANAGEMENT_API_KEY
 from arcanna_mcp_server.models.agentic.env_variable import EnvVariable
 from arcanna_mcp_server.models.agentic.workflow_settings import WorkflowSettings
 from arcanna_mcp_server.utils.exceptions_handler import handle_exceptions
+from arcanna_mcp_server.utils.client_session import LONG_RUNNING_REQUEST_TIMEOUT
 from arcanna_mcp_server.utils.post_data import post_data
 from arcanna_mcp_server.utils.get_data import get_data
 from arcanna_mcp_server.utils.tool_scopes import requires_scope
 
 
-def _headers():
-    return {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json",
-    }
+_WORKFLOWS_CACHE_TTL_SECONDS = 30
+# (expires_at, workflows) for the last successful list_agentic_workflows call
+_workflows_cache = None
+# Concurrent cache misses wait for a single in-flight request instead of each fetching the list
+_workflows_cache_lock = asyncio.Lock()
+
+
+def _invalidate_workflows_cache():
+    global _workflows_cache
+    _workflows_cache = None
 
 
 def export_tools() -> List[Callable]:
@@ -39,17 +46,27 @@ async def list_agentic_workflows():
     """
     List all available agentic workflows. Returns a summary of each workflow including its ID, name, and description.
     """
-    response = await get_data(LIST_WORKFLOWS_URL, _headers())
-    entries = response.get("entries")
-    if entries is None:
-        return response
+    global _workflows_cache
+    if _workflows_cache is not None and time.monotonic() < _workflows_cache[0]:
+        return _workflows_cache[1]
+
+    async with _workflows_cache_lock:
+        if _workflows_cache is not None and time.monotonic() < _workflows_cache[0]:
+            return _workflows_cache[1]
+
+        response = await get_data(LIST_WORKFLOWS_URL)
+        entries = response.get("entries")
+        if entries is None:
+            return response
 
-    return [{
-        "id": entry.get("id"),
-        "name": entry.get("name"),
-        "description": entry.get("description"),
-        "is_shared": entry.get("is_shared", False)
-    } for entry in entries]
+        workflows = [{
+            "id": entry.get("id"),
+            "name": entry.get("name"),
+            "description": entry.get("description"),
+            "is_shared": entry.get("is_shared", False)
+        } for entry in entries]
+        _workflows_cache = (time.monotonic() + _WORKFLOWS_CACHE_TTL_SECONDS, workflows)
+        return workflows
 
 
 @handle_exceptions
@@ -60,7 +77,7 @@ async def get_agentic_workflow_by_id(
     """
     Fetch full details of an agentic workflow by its ID.
     """
-    return await get_data(GET_WORKFLOW_BY_ID_URL.format(workflow_id), _headers())
+    return await get_data(GET_WORKFLOW_BY_ID_URL.format(workflow_id))
 
 
 @handle_exceptions
@@ -83,7 +100,7 @@ async def run_agentic_workflow(
         "session_id": session_id,
     }
 
-    return await post_data(RUN_WORKFLOW_BY_ID_URL.format(str(workflow_id)), _headers(), payload)
+    return await post_data(RUN_WORKFLOW_BY_ID_URL.format(workflow_id), payload, timeout=LONG_RUNNING_REQUEST_TIMEOUT)
 
 
 @handle_exceptions
@@ -110,7 +127,7 @@ async def test_agentic_workflow(
         "env_variables": [v.model_dump() for v in env_variables] if env_variables else None,
     }
 
-    return await post_data(TEST_RUN_WORKFLOW_BY_ID_URL, _headers(), payload)
+    return await post_data(TEST_RUN_WORKFLOW_BY_ID_URL, payload, timeout=LONG_RUNNING_REQUEST_TIMEOUT)
 
 
 @handle_exceptions
@@ -129,7 +146,9 @@ async def create_agentic_workflow(
         "env_variables": [v.model_dump() for v in env_variables] if env_variables else None,
     }
 
-    return await post_data(UPSERT_WORKFLOWS_URL, _headers(), payload)
+    response = await post_data(UPSERT_WORKFLOWS_URL, payload)
+    _invalidate_workflows_cache()
+    return response
 
 
 @handle_exceptions
@@ -151,7 +170,9 @@ async def update_agentic_workflow(
         "env_variables": [v.model_dump() for v in env_variables] if env_variables else None,
     }
 
-    return await post_data(UPSERT_WORKFLOWS_URL, _headers(), payload)
+    response = await post_data(UPSERT_WORKFLOWS_URL, payload)
+    _invalidate_workflows_cache()
+    return response
 
 
 @handle_exceptions
@@ -161,7 +182,7 @@ async def agents_tool_discovery() -> dict:
     Discover tools for agents in agentic workflows. These tools can be found in Arcanna's environment where agents run
     and have access to them.
     """
-    return await get_data(TOOL_DISCOVERY_URL, _headers())
+    return await get_data(TOOL_DISCOVERY_URL)
 
 
 @handle_exceptions
@@ -170,4 +191,4 @@ async def get_llm_integrations() -> dict:
     """
     Discover llm integrations to choose one or multiple providers for the model used in agentic workflows.
     """
-    return await get_data(LLM_PROVIDERS_DISCOVERY_URL, _headers())
+    return await get_data(LLM_PROVIDERS_DISCOVERY_URL)
@@ -1,55 +1,12 @@
-import requests
 from typing import Optional, List, Callable
-from arcanna_mcp_server.environment import MANAGEMENT_API_KEY
 from arcanna_mcp_server.utils.exceptions_handler import handle_exceptions
 from arcanna_mcp_server.constants import CUSTOM_CODE_BLOCK_TEST_URL, CUSTOM_CODE_BLOCK_SAVE_URL
+from arcanna_mcp_server.utils.client_session import LONG_RUNNING_REQUEST_TIMEOUT
+from arcanna_mcp_server.utils.post_data import post_data
 from arcanna_mcp_server.utils.tool_scopes import requires_scope
 
 
-def export_tools() -> List[Callable]:
-    return [
-        generate_code_instructions,
-        save_code,
-        execute_code
-     ]
-
-
-# def compute_python_function(user_query: str) -> str:
-#     return ""
-#
-#
-# @handle_exceptions
-# async def generate_code_agent(user_query: str) -> str:
-#     """
-#     Tool to be used when generating code is requested.
-#     Use this method to generate a code block from a user query.
-#     After executing this tool ask the user if he wants to execute the code block using the execute_code tool.
-#
-#     Parameters:
-#     -----------
-#     user_query : str
-#         User query to generate a code block from chat.
-#
-#     Returns:
-#     --------
-#     str
-#          A Python function that follows the template: def transform(input_record):     # body of the function\n    return input_record
-#     """
-#     return compute_python_function(user_query)
-
-
-@handle_exceptions
-@requires_scope('public')
-async def generate_code_instructions() -> str:
-    """
-    Generates instructions for creating a Python code block for Arcanna integration.
-    This tool should be used whenever code generation is requested.
-
-    Returns:
-        str: Instructions for generating a Python code block compatible with Arcanna integration.
-    """
-
-    custom_code_block_system_prompt = """
+CUSTOM_CODE_BLOCK_SYSTEM_PROMPT = """
     1. Generate the code following the instructions below.
     2. Test the code using execute_tool provided.
     3. Show to the user the result and ask for saving the code approval.
@@ -114,7 +71,51 @@ async def generate_code_instructions() -> str:
     - Return only the function body and nothing else.
     - The first line should be the function definition. The last line should be the return statement.
     """
-    return custom_code_block_system_prompt
+
+
+def export_tools() -> List[Callable]:
+    return [
+        generate_code_instructions,
+        save_code,
+        execute_code
+     ]
+
+
+# def compute_python_function(user_query: str) -> str:
+#     return ""
+#
+#
+# @handle_exceptions
+# async def generate_code_agent(user_query: str) -> str:
+#     """
+#     Tool to be used when generating code is requested.
+#     Use this method to generate a code block from a user query.
+#     After executing this tool ask the user if he wants to execute the code block using the execute_code tool.
+#
+#     Parameters:
+#     -----------
+#     user_query : str
+#         User query to generate a code block from chat.
+#
+#     Returns:
+#     --------
+#     str
+#          A Python function that follows the template: def transform(input_record):     # body of the function\n    return input_record
+#     """
+#     return compute_python_function(user_query)
+
+
+@handle_exceptions
+@requires_scope('public')
+async def generate_code_instructions() -> str:
+    """
+    Generates instructions for creating a Python code block for Arcanna integration.
+    This tool should be used whenever code generation is requested.
+
+    Returns:
+        str: Instructions for generating a Python code block compatible with Arcanna integration.
+    """
+    return CUSTOM_CODE_BLOCK_SYSTEM_PROMPT
 
 
 @handle_exceptions
@@ -169,12 +170,8 @@ async def execute_code(source_code: str, input_test: dict, job_id: Optional[int]
     if settings:
         body["settings"] = settings
 
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
-    response = requests.post(CUSTOM_CODE_BLOCK_TEST_URL, json=body, headers=headers)
-    return response.json()
+    _, response = await post_data(CUSTOM_CODE_BLOCK_TEST_URL, body, timeout=LONG_RUNNING_REQUEST_TIMEOUT)
+    return response
 
 
 @handle_exceptions
@@ -239,9 +236,5 @@ async def save_code(title: str, description: str, source_code: str, input_test:
     if settings:
         body["settings"] = settings
 
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
-    response = requests.post(CUSTOM_CODE_BLOCK_SAVE_URL, json=body, headers=headers)
-    return response.json()
+    _, response = await post_data(CUSTOM_CODE_BLOCK_SAVE_URL, body)
+    return response
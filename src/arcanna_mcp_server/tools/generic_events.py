@@ -1,26 +1,56 @@
-import requests
-from typing import List, Callable, Literal, Optional, Union, Dict, Any
-from arcanna_mcp_server.environment import MANAGEMENT_API_KEY
+import asyncio
+import functools
+import json
+import time
+from typing import List, Callable, Optional, Union, Dict, Any
 from arcanna_mcp_server.utils.exceptions_handler import handle_exceptions
-from arcanna_mcp_server.models.generic_events import EventsModelResponse, TransferEventResponse
+from arcanna_mcp_server.utils.request_data import request_data
+from arcanna_mcp_server.models.generic_events import EventFeedback, EventsQuery, TransferEventResponse
 from arcanna_mcp_server.models.filters import FilterFieldsObject
 from arcanna_mcp_server.constants import (
-    EXPORT_EVENT_URL, INGEST_EVENT_URL, QUERY_EVENTS_URL, FILTER_FIELDS_URL, EVENT_FEEDBACK_URL_V2, \
+    EXPORT_EVENT_URL, INGEST_EVENT_URL, FILTER_FIELDS_URL, EVENT_FEEDBACK_URL_V2, \
     ADD_AGENTIC_NOTES_URL, REPROCESS_EVENTS_URL, REPROCESS_EVENT_URL, RAW_ES_QUERY_EVENTS_URL, FIELDS_MAPPING_URL
 )
+from arcanna_mcp_server.utils.gather_results import gather_results
 from arcanna_mcp_server.utils.tool_scopes import requires_scope
 
 
+_FIELDS_MAPPING_CACHE_TTL_SECONDS = 300
+_FIELDS_MAPPING_CACHE_MAX_ENTRIES = 128
+# (job_ids, job_titles) -> (expires_at, fields_mapping)
+_fields_mapping_cache = {}
+# Serialized request body -> task of the query currently in flight
+_inflight_queries = {}
+
+
+def _fields_mapping_cache_key(job_ids, job_titles):
+    def normalize(values):
+        if not values:
+            return ()
+        if isinstance(values, (list, tuple)):
+            return tuple(sorted(values))
+        return (values,)
+
+    return normalize(job_ids), normalize(job_titles)
+
+
+def invalidate_fields_mapping_cache():
+    _fields_mapping_cache.clear()
+
+
 def export_tools() -> List[Callable]:
     return [
         add_agentic_notes,
         add_feedback_to_event,
+        add_feedback_to_events,
         reprocess_events,
         reprocess_event_by_id,
         export_event_by_id,
         transfer_event,
+        transfer_events,
         get_fields_mapping,
-        query_arcanna_events
+        query_arcanna_events,
+        batch_query_arcanna_events
     ]
 
 @handle_exceptions
@@ -64,11 +94,6 @@ async def add_agentic_notes(job_id: int, event_id: Union[str, int], workflow_nam
     if agent_saved_objects is None:
         agent_saved_objects = {}
 
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
-
     payload = {
         "agent_notes": agent_notes,
         "agent_saved_objects": agent_saved_objects
@@ -82,12 +107,12 @@ async def add_agentic_notes(job_id: int, event_id: Union[str, int], workflow_nam
     if session_id is not None:
         payload["session_id"] = session_id
 
-    response = requests.post(
-        ADD_AGENTIC_NOTES_URL.format(job_id=str(job_id), event_id=str(event_id)),
-        headers=headers,
-        json=payload
+    _, response = await request_data(
+        "POST",
+        ADD_AGENTIC_NOTES_URL.format(job_id=job_id, event_id=event_id),
+        payload
     )
-    return response.json()
+    return response
 
 
 @handle_exceptions
@@ -122,12 +147,8 @@ async def get_filter_fields(job_ids: Optional[Union[List[int], int]] = None,
     if job_titles:
         body["job_titles"] = job_titles
 
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
-    response = requests.post(FILTER_FIELDS_URL, json=body, headers=headers)
-    return response.json()
+    _, response = await request_data("POST", FILTER_FIELDS_URL, body)
+    return response
 
 
 @handle_exceptions
@@ -158,12 +179,26 @@ async def get_fields_mapping(job_ids: Optional[Union[List[int], int]] = None,
     if job_titles:
         body["job_titles"] = job_titles
 
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
-    response = requests.post(FIELDS_MAPPING_URL, json=body, headers=headers)
-    return response.json()
+    cache_key = _fields_mapping_cache_key(job_ids, job_titles)
+    cached = _fields_mapping_cache.get(cache_key)
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+
+    status, response = await request_data("POST", FIELDS_MAPPING_URL, body)
+    if status == 200:
+        if len(_fields_mapping_cache) >= _FIELDS_MAPPING_CACHE_MAX_ENTRIES:
+            _fields_mapping_cache.clear()
+        _fields_mapping_cache[cache_key] = (time.monotonic() + _FIELDS_MAPPING_CACHE_TTL_SECONDS, response)
+    return response
+
+
+async def _send_event_feedback(job_id: int, event_id: Union[str, int], label: str, storage_name: Optional[str] = None):
+    params = {"feedback_label": label}
+    if storage_name:
+        params["storage_name"] = storage_name
+
+    _, response = await request_data("PUT", EVENT_FEEDBACK_URL_V2.format(job_id, event_id), params=params)
+    return response
 
 
 @handle_exceptions
@@ -194,11 +229,6 @@ async def add_feedback_to_event(job_id: int, event_id: Union[str, int], label: s
 
         - status (str): Specifies if the feedback was successfully sent or not.
     """
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
-
     if job_id is None:
         raise Exception("Job ID is required.")
 
@@ -208,12 +238,77 @@ async def add_feedback_to_event(job_id: int, event_id: Union[str, int], label: s
     if label is None:
         raise Exception("Label is required.")
 
-    formatted_url = EVENT_FEEDBACK_URL_V2.format(job_id, event_id) + f'?feedback_label={label}'
-    if storage_name:
-        formatted_url += f'&storage_name={storage_name}'
+    return await _send_event_feedback(job_id, event_id, label, storage_name)
+
+
+@handle_exceptions
+@requires_scope('write:event_feedback')
+async def add_feedback_to_events(job_id: int, feedbacks: List[EventFeedback]) -> List[dict]:
+    """
+    Provide feedback on multiple events previously ingested by the same Arcanna job in a single call. Use this instead of
+    calling add_feedback_to_event repeatedly when labeling a batch of events. The feedback requests are sent concurrently.
+
+    Parameters:
+    -----------
+    job_id : int
+        Unique identifier for the job.
+    feedbacks : list
+        Feedback entries, each with:
+        - event_id (str or int): Unique identifier of the event you want to provide feedback for.
+        - label (str): Decision label to be applied for the event. Can be for example Escalate or Drop.
+        - storage_name (str or None): Storage name to be used for feedback. Use only if the job have multiple storages defined.
+
+    Returns:
+    --------
+    list
+        One result per feedback entry, in the same order. Each is the feedback response of that event
+        or a dictionary with status_code and error_message if sending it failed.
+    """
+    if job_id is None:
+        raise Exception("Job ID is required.")
+
+    return await gather_results(
+        _send_event_feedback(job_id, feedback.event_id, feedback.label, feedback.storage_name)
+        for feedback in feedbacks
+    )
+
+
+def _forget_inflight_query(query_key: str, query_task: asyncio.Future):
+    _inflight_queries.pop(query_key, None)
+    if not query_task.cancelled():
+        # Marks the exception as retrieved in case every caller was cancelled before the request failed
+        query_task.exception()
+
+
+async def _query_events(job_ids: Optional[Union[List[int], int]] = None,
+                        job_titles: Optional[Union[List[str], str]] = None,
+                        query_body: Optional[Dict[str, Any]] = None,
+                        decision_points_only: Optional[bool] = False):
+    body = {}
 
-    response = requests.put(formatted_url, headers=headers)
-    return response.json()
+    if job_ids:
+        body["job_ids"] = job_ids
+
+    if job_titles:
+        body["job_titles"] = job_titles
+
+    if query_body:
+        body["query_body"] = query_body
+
+    if decision_points_only:
+        body["decision_points_only"] = decision_points_only
+
+    # Identical queries issued while one is in flight share its request instead of hitting the backend again
+    query_key = json.dumps(body, sort_keys=True)
+    query_task = _inflight_queries.get(query_key)
+    if query_task is None:
+        query_task = asyncio.ensure_future(request_data("POST", RAW_ES_QUERY_EVENTS_URL, body))
+        _inflight_queries[query_key] = query_task
+        query_task.add_done_callback(functools.partial(_forget_inflight_query, query_key))
+
+    # Shielded so a cancelled caller does not cancel the request for the others awaiting it
+    _, response = await asyncio.shield(query_task)
+    return response
 
 
 @handle_exceptions
@@ -319,236 +414,36 @@ async def query_arcanna_events(job_ids: Optional[Union[List[int], int]] = None,
                   }
                 }
     """
-    body = {}
+    return await _query_events(job_ids, job_titles, query_body, decision_points_only)
 
-    if job_ids:
-        body["job_ids"] = job_ids
 
-    if job_titles:
-        body["job_titles"] = job_titles
-
-    if query_body:
-        body["query_body"] = query_body
+@handle_exceptions
+@requires_scope('read:event_query')
+async def batch_query_arcanna_events(queries: List[EventsQuery]) -> List[dict]:
+    """
+    Run multiple event queries in a single call, for example the same query against several jobs or several
+    aggregations over the same job. Use this instead of calling query_arcanna_events repeatedly.
+    The queries are sent concurrently.
 
-    if decision_points_only:
-        body["decision_points_only"] = decision_points_only
+    Parameters:
+    -----------
+    queries : list
+        Queries to run, each with:
+        - job_ids (int or list of int or None): Job IDs to filter on.
+        - job_titles (str or list of str or None): Job titles to filter on.
+        - query_body (dict or None): Elasticsearch query body, same format and fields as the query_body of query_arcanna_events.
+        - decision_points_only (bool or None): If set to true, only decision points will be included in the events response.
 
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
-    response = requests.post(RAW_ES_QUERY_EVENTS_URL, json=body, headers=headers)
-    return response.json()
-
-# @handle_exceptions
-# async def query_arcanna_events(job_ids: Optional[Union[List[int], int]] = None,
-#                                job_titles: Optional[Union[List[str], str]] = None,
-#                                event_ids: Optional[Union[List[str], str]] = None,
-#                                decision_points_only: Optional[bool] = False,
-#                                count_results_only: Optional[bool] = False,
-#                                start_date: Optional[str] = None,
-#                                end_date: Optional[str] = None,
-#                                date_field: Optional[str] = "@timestamp",
-#                                size: Optional[int] = 5,
-#                                page: Optional[int] = 0,
-#                                sort_by_column: Optional[str] = "@timestamp",
-#                                sort_order: Optional[Literal['desc', 'asc']] = "desc",
-#                                filters: Optional[List[dict]] = None
-#                                ) -> EventsModelResponse:
-#     """
-#     Query events filtered by job IDs, job titles, event IDs, or specific filtering criteria (size, start_date, end_date, filters).
-#     At least one of 'job_ids', 'job_titles', 'event_ids', 'size', 'filters', 'start_date', or 'end_date' must be provided.
-#     Both the job_ids and job_title fields may be missing.
-#     If neither job_ids nor job_titles are provided, the search will include events across all jobs.
-#     When working with timestamps: the '@timestamp' field represents the original alert/event timestamp, while the 'timestamp_inference' field represents the time it was ingested into Arcanna.
-#     In case of an internal server error, show the error to the user and do not use any other tool, ask the user how he would like to continue.
-#
-#     Parameters:
-#     -----------
-#     job_ids : int or list of int or None
-#         Job IDs to filter on.
-#     job_titles : str or list of str or None
-#         Job titles to filter on.
-#     event_ids : str or list of str or None
-#         Events IDs to filter on.
-#     decision_points_only : bool or None
-#          If set to true, only decision points will be included in the events response, excluding the full event.
-#     count_results_only : bool or None
-#          If set to true, only the total count of events will be returned, and no events.
-#     start_date : str or None
-#         Start date to filter events newer than this date.
-#         Date format:
-#           - ISO 8601 date string (e.g., 'YYYY-MM-DD' or 'YYYY-MM-DDTHH:MM:SS')
-#     end_date : str or None
-#         End date to filter events older than this date.
-#         Date format:
-#           - ISO 8601 date string (e.g., 'YYYY-MM-DD' or 'YYYY-MM-DDTHH:MM:SS')
-#     date_field : str or None
-#         The field to be used for date range filtering. Defaults to the '@timestamp' field; use the default field unless the user specifies a different one.
-#     size : int or None
-#         Number of events to include in response. If job_ids or job_titles provided it is the number of events per job.
-#     page : int or None (page counting starts from 0, default: 0)
-#         Page number, used for pagination. Keep size parameter fixed and increase page size to get more results.
-#     sort_by_column : str or None
-#         The field used to sort events. Defaults to the '@timestamp' field; use the default field unless the user specifies a different one.
-#     sort_order : str or None
-#         The order in which to sort events by. Defaults to 'desc' order; use the default order unless the user specifies a different one.
-#     filters : list of dict or None
-#       Filters to apply to the events returned by the query. If multiple filters are provided, they function as an AND operator between the filters.
-#       Each filter in list is a dictionary with keys: "field", "operator" and "value"
-#       - field - the field to apply filters to
-#       - operator can be: "is", "is not", "is one of", "is not one of", "starts with", "not starts with", "contains", "not contains", "exists", "not exists", "lt", "lte", "gte", "gte"
-#       - value to filter by, value is omitted for operators "exists" and "not exists"
-#
-#         Arcanna fields:
-#             1. Arcanna decision field = "arcanna.result_label"
-#             2. Arcanna consensus field = "arcanna.consensus"
-#             3. Arcanna outlier field flag = "arcanna.outlier_flag"
-#             4. Arcanna in model status field = "arcanna.knowledge_base_state" or "arcanna.bucket_state"
-#             5. Arcanna low confidence warning flag field = "attention.low_confidence_score.attention_required"
-#             6. Arcanna undecided warning flag field = "attention.undecided_consensus.attention_required"
-#
-#         Predefined filters:
-#          1. Query outlier events:
-#             {{
-#                 "filters": [{{
-#                     "field": "arcanna.outlier_flag",
-#                     "operator": "is",
-#                     "value": true
-#                     }}]
-#             }}
-#          2. Query events with low confidence score:
-#             {{
-#                 "filters": [{{
-#                     "field": "arcanna.attention.low_confidence_score.attention_required",
-#                     "operator": "is",
-#                     "value": true
-#                     }}]
-#             }}
-#          3. Query events with undecided consensus:
-#             {{
-#                 "filters": [{{
-#                     "field": "arcanna.attention.undecided_consensus.attention_required",
-#                     "operator": "is",
-#                     "value": true
-#                     }}]
-#             }}
-#          4. Query events with any feedback (Event Centric Decision Intelligence job):
-#             {{
-#                 "filters": [{{
-#                     "field": "arcanna.knowledge_base_state",
-#                     "operator": "is",
-#                     "value": "new"
-#                     }}]
-#             }}
-#          5. Query events without any feedback (Event Centric Decision Intelligence job):
-#             {{
-#                 "filters": [{{
-#                     "field": "arcanna.knowledge_base_state",
-#                     "operator": "is not",
-#                     "value": "new"
-#                     }}]
-#             }}
-#          6. Query events with any feedback (Decision Intelligence job):
-#             {{
-#                 "filters": [{{
-#                     "field": "arcanna.bucket_state",
-#                     "operator": "is",
-#                     "value": "new"
-#                     }}]
-#             }}
-#          7. Query events without any feedback (Decision Intelligence job):
-#             {{
-#                 "filters": [{{
-#                     "field": "arcanna.bucket_state",
-#                     "operator": "is not",
-#                     "value": "new"
-#                     }}]
-#             }}
-#          8. Query events marked as 'Escalate' or 'Investigate' by Arcanna:
-#             {{
-#                 "filters": [{{
-#                     "field": "arcanna.result_label",
-#                     "operator": "is one of",
-#                     "value": ['Escalate', 'Investigate']
-#                     }}]
-#             }}
-#          9. Query events not marked as 'Drop' or 'Low priority' by Arcanna:
-#             {{
-#                 "filters": [{{
-#                     "field": "arcanna.result_label",
-#                     "operator": "is not one of",
-#                     "value": ['Drop', 'Low priority']
-#                     }}]
-#             }}
-#          10. Query events with consensus 'Escalate' or 'Drop':
-#             {{
-#             "filters": [{{
-#                 "field": "arcanna.consensus",
-#                 "operator": "is one of",
-#                 "value": ['Escalate', 'Drop']
-#                 }}]
-#             }}
-#
-#     Returns:
-#     --------
-#     list of dictionary
-#     A dictionary containing job details with the following keys:
-#         - event_id (str): Unique identifier for the event.
-#         - job_id (int): Unique identifier of the job where the event was pulled from.
-#         - job_title (str): Unique identifier for the job where the event was pulled from.
-#         - decision_points (dict): Dictionary of decision points. Each key in decision_points is a feature used in model training.
-#         - arcanna (dict or None): Dictionary containing fields added by Arcanna processing.
-#         - raw_event (dict or None): Dictionary containing the raw event data. Event timestamp field is '@timestamp' (use it every time when event/alert timestamp is requested).
-#     """
-#
-#     body = {}
-#
-#     if job_ids:
-#         body["job_ids"] = job_ids
-#
-#     if job_titles:
-#         body["job_titles"] = job_titles
-#
-#     if event_ids:
-#         body["event_ids"] = event_ids
-#
-#     if decision_points_only:
-#         body["decision_points_only"] = decision_points_only
-#
-#     if count_results_only:
-#         body["count_results_only"] = count_results_only
-#
-#     if start_date:
-#         body["start_date"] = start_date
-#
-#     if end_date:
-#         body["end_date"] = end_date
-#
-#     if date_field:
-#         body["date_field"] = date_field
-#
-#     if page:
-#         body["page"] = page
-#
-#     if size:
-#         body["size"] = size
-#
-#     if sort_by_column:
-#         body["sort_by_column"] = sort_by_column
-#
-#     if sort_order:
-#         body["sort_order"] = sort_order
-#
-#     if filters:
-#         body["filters"] = filters
-#
-#     headers = {
-#         "x-arcanna-api-key": MANAGEMENT_API_KEY,
-#         "Content-Type": "application/json"
-#     }
-#     response = requests.post(QUERY_EVENTS_URL, json=body, headers=headers)
-#     return response.json()
+    Returns:
+    --------
+    list
+        One result per query, in the same order. Each is the response of that query
+        or a dictionary with status_code and error_message if it failed.
+    """
+    return await gather_results(
+        _query_events(query.job_ids, query.job_titles, query.query_body, query.decision_points_only)
+        for query in queries
+    )
 
 
 @handle_exceptions
@@ -576,7 +471,7 @@ async def reprocess_events(job_id: Union[str, int], start_date: Optional[str] =
           Filters to apply to the events returned by the query. If multiple filters are provided, they function as an AND operator between the filters.
           Each filter in list is a dictionary with keys: "field", "operator" and "value"
           - field - the field to apply filters to
-          - operator can be: "is", "is not", "is one of", "is not one of", "starts with", "not starts with", "contains", "not contains", "exists", "not exists", "lt", "lte", "gte", "gte"
+          - operator can be: "is", "is not", "is one of", "is not one of", "starts with", "not starts with", "contains", "not contains", "exists", "not exists", "lt", "lte", "gt", "gte"
           - value to filter by, value is omitted for operators "exists" and "not exists"
 
         Arcanna fields:
@@ -683,8 +578,6 @@ async def reprocess_events(job_id: Union[str, int], start_date: Optional[str] =
 
     body = {}
 
-    job_id = job_id
-
     if start_date:
         body["start_date"] = start_date
 
@@ -697,12 +590,8 @@ async def reprocess_events(job_id: Union[str, int], start_date: Optional[str] =
     if filters:
         body["filters"] = filters
 
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
-    response = requests.post(REPROCESS_EVENTS_URL.format(str(job_id)), json=body, headers=headers)
-    return response.json()
+    _, response = await request_data("POST", REPROCESS_EVENTS_URL.format(job_id), body)
+    return response
 
 
 @handle_exceptions
@@ -727,12 +616,8 @@ async def reprocess_event_by_id(job_id: int, event_id: str):
             - reason_details: str - In case of an error, contains details about the error
     """
 
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
-    response = requests.post(REPROCESS_EVENT_URL.format(job_id, event_id), headers=headers)
-    return response.json()
+    _, response = await request_data("POST", REPROCESS_EVENT_URL.format(job_id, event_id))
+    return response
 
 
 @handle_exceptions
@@ -753,13 +638,32 @@ async def export_event_by_id(job_id: int, event_id: Union[int, str]) -> dict:
     -----------
     The event ingested by the job in JSON format.
     """
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content_Type": "application/json"
+    _, response = await request_data("GET", EXPORT_EVENT_URL.format(job_id, event_id))
+    return response
+
+
+async def _transfer_event(source_job_id: int, event_id: Union[int, str], destination_job_id: int,
+                          destination_storage_tag_name: Optional[str] = None):
+    status, response = await request_data("GET", EXPORT_EVENT_URL.format(source_job_id, event_id))
+    if status != 200:
+        return TransferEventResponse(status="NOK", error_message=json.dumps(response))
+
+    event_source = response.get("arcanna_event")
+    if event_source is None:
+        return TransferEventResponse(status=f"NOK", error_message=f"Event with id {event_id} not found in source job with id {source_job_id}")
+
+    body = {
+        "job_id": destination_job_id,
+        "raw_body": event_source
     }
+    if destination_storage_tag_name is not None:
+        body["storage_tag"] = destination_storage_tag_name
 
-    response = requests.get(EXPORT_EVENT_URL.format(job_id, event_id), headers=headers)
-    return response.json()
+    status, response = await request_data("POST", INGEST_EVENT_URL, body)
+    if 200 <= status < 300:
+        # The ingested event can add fields to the destination job's mapping
+        invalidate_fields_mapping_cache()
+    return response
 
 
 @handle_exceptions
@@ -782,25 +686,38 @@ async def transfer_event(source_job_id: int, event_id: Union[int, str],
         In case the destination job is configured as a multi-input job the storage_tag will specify
         from wich input integration the event is sent.
     """
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content_Type": "application/json"
-    }
+    return await _transfer_event(source_job_id, event_id, destination_job_id, destination_storage_tag_name)
 
-    response = requests.get(EXPORT_EVENT_URL.format(source_job_id, event_id), headers=headers)
-    if response.status_code != 200:
-        return TransferEventResponse(status="NOK", error_message=response.json())
 
-    event_source = response.json().get("arcanna_event")
-    if event_source is None:
-        return TransferEventResponse(status=f"NOK", error_message=f"Event with id {event_id} not found in source job with id {source_job_id}")
+@handle_exceptions
+@requires_scope('read:event_export', 'write:events')
+async def transfer_events(source_job_id: int, event_ids: List[Union[int, str]],
+                          destination_job_id: int, destination_storage_tag_name: Optional[str] = None
+                          ) -> List[Union[TransferEventResponse, dict]]:
+    """
+    Transfer multiple events identified by their ids from a source job to a new destination job in a single call.
+    Use this instead of calling transfer_event repeatedly. The events are transferred concurrently.
+    Events will still exist in the source job. They will be sent as copies to the destination job.
 
-    body = {
-        "job_id": destination_job_id,
-        "raw_body": event_source
-    }
-    if destination_storage_tag_name is not None:
-        body["storage_tag"] = destination_storage_tag_name
+    Parameters:
+    -----------
+    source_job_id: int
+        Unique identifier of the job where the events are stored initially.
+    event_ids: list of str or int
+        Unique identifiers of the events to be transfered. These are located in the source job.
+    destination_job_id: int
+        Unique identifier of the job where the events will be stored after transfer.
+    destination_storage_tag_name: string or None
+        In case the destination job is configured as a multi-input job the storage_tag will specify
+        from wich input integration the events are sent.
 
-    response = requests.post(INGEST_EVENT_URL, json=body, headers=headers)
-    return response.json()
+    Returns:
+    --------
+    list
+        One result per event id, in the same order. Each is the transfer result of that event
+        or a dictionary with status_code and error_message if transferring it failed.
+    """
+    return await gather_results(
+        _transfer_event(source_job_id, event_id, destination_job_id, destination_storage_tag_name)
+        for event_id in event_ids
+    )
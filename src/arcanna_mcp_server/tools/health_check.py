@@ -1,8 +1,7 @@
 from typing import Callable, List
-import requests
-from arcanna_mcp_server.environment import MANAGEMENT_API_KEY
 from arcanna_mcp_server.constants import HEALTH_CHECK_URL
 from arcanna_mcp_server.utils.exceptions_handler import handle_exceptions
+from arcanna_mcp_server.utils.request_data import request_data
 from arcanna_mcp_server.utils.tool_scopes import requires_scope
 
 
@@ -25,9 +24,6 @@ async def health_check() -> dict:
             - reason (str): Short description of the error if one occurred; empty if successful.
             - reason_details:  (str): A message describing the error if one occurred; empty if successful.
     """
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
-    response = requests.get(HEALTH_CHECK_URL, headers=headers)
-    return response.json()
+    # A 503 from the health endpoint is the answer, not a transient error
+    _, response = await request_data("GET", HEALTH_CHECK_URL, retry=False)
+    return response
@@ -1,8 +1,7 @@
 from typing import Callable, List
 from arcanna_mcp_server.constants import START_JOB_URL, STOP_JOB_URL, TRAIN_JOB_URL
-from arcanna_mcp_server.environment import MANAGEMENT_API_KEY
-import requests
 from arcanna_mcp_server.utils.exceptions_handler import handle_exceptions
+from arcanna_mcp_server.utils.request_data import request_data
 from arcanna_mcp_server.utils.tool_scopes import requires_scope
 
 
@@ -32,13 +31,8 @@ async def start_job(job_id: int) -> dict:
         - reason_details:  (str): A message describing the error if one occurred; empty if successful.
      """
 
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
-
-    response = requests.post(START_JOB_URL.format(job_id), headers=headers)
-    return response.json()
+    _, response = await request_data("POST", START_JOB_URL.format(job_id))
+    return response
 
 
 @handle_exceptions
@@ -59,13 +53,8 @@ async def stop_job(job_id: int) -> dict:
         - reason (str): Short description of the error if one occurred; empty if successful.
         - reason_details:  (str): A message describing the error if one occurred; empty if successful.
     """
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
-
-    response = requests.post(STOP_JOB_URL.format(job_id), headers=headers)
-    return response.json()
+    _, response = await request_data("POST", STOP_JOB_URL.format(job_id))
+    return response
 
 
 @handle_exceptions
@@ -87,10 +76,5 @@ async def train_job(job_id: int) -> dict:
         - reason_details:  (str): A message describing the error if one occurred; empty if successful.
     """
 
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
-
-    response = requests.post(TRAIN_JOB_URL.format(job_id), headers=headers)
-    return response.json()
+    _, response = await request_data("POST", TRAIN_JOB_URL.format(job_id))
+    return response
@@ -1,7 +1,6 @@
-import requests
 from typing import Callable, List
-from arcanna_mcp_server.environment import MANAGEMENT_API_KEY
 from arcanna_mcp_server.utils.exceptions_handler import handle_exceptions
+from arcanna_mcp_server.utils.request_data import request_data
 from arcanna_mcp_server.models.metrics import GetJobMetricsResponse, GetJobAndLatestModelMetricsResponse, GetModelMetricsResponse
 from arcanna_mcp_server.constants import METRICS_JOB_URL, METRICS_JOB_AND_LATEST_MODEL_URL, METRICS_MODEL_URL, METRICS_MODEL_URL_REQUEST_RECOMPUTE_METRICS
 from arcanna_mcp_server.utils.tool_scopes import requires_scope
@@ -37,7 +36,7 @@ async def metrics_job(job_id: int, start_date: str=None, end_date: str=None, fil
       Filters to apply to the events returned by the query. If multiple filters are provided, they function as an AND operator between the filters.
       Each filter in list is a dictionary with keys: "field", "operator" and "value"
       - field - the field to apply filters to
-      - operator can be: "is", "is not", "is one of", "is not one of", "starts with", "not starts with", "contains", "not contains", "exists", "not exists", "lt", "lte", "gte", "gte"
+      - operator can be: "is", "is not", "is one of", "is not one of", "starts with", "not starts with", "contains", "not contains", "exists", "not exists", "lt", "lte", "gt", "gte"
       - value to filter by, value is omitted for operators "exists" and "not exists"
 
         Arcanna fields:
@@ -143,10 +142,6 @@ async def metrics_job(job_id: int, start_date: str=None, end_date: str=None, fil
         - all_model_ids (list or none) : List of all model identifiers
      """
 
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
     formatted_url = METRICS_JOB_URL + f'?job_id={job_id}'
     if start_date:
         formatted_url += f'&start_datetime={start_date}'
@@ -157,8 +152,8 @@ async def metrics_job(job_id: int, start_date: str=None, end_date: str=None, fil
     if filters:
         payload = {"filters": filters}
 
-    response = requests.post(formatted_url.format(job_id), headers=headers, json=payload)
-    return response.json()
+    _, response = await request_data("POST", formatted_url.format(job_id), payload)
+    return response
 
 
 @handle_exceptions
@@ -182,7 +177,7 @@ async def metrics_job_and_latest_model(job_id: int, start_date: str=None, end_da
       Filters to apply to the events returned by the query. If multiple filters are provided, they function as an AND operator between the filters.
       Each filter in list is a dictionary with keys: "field", "operator" and "value"
       - field - the field to apply filters to
-      - operator can be: "is", "is not", "is one of", "is not one of", "starts with", "not starts with", "contains", "not contains", "exists", "not exists", "lt", "lte", "gte", "gte"
+      - operator can be: "is", "is not", "is one of", "is not one of", "starts with", "not starts with", "contains", "not contains", "exists", "not exists", "lt", "lte", "gt", "gte"
       - value to filter by, value is omitted for operators "exists" and "not exists"
 
         Arcanna fields:
@@ -299,10 +294,6 @@ async def metrics_job_and_latest_model(job_id: int, start_date: str=None, end_da
             - metrics_per_decision (Dict[str, MetricsPerDecision]): Metrics per decision type
      """
 
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
     formatted_url = METRICS_JOB_AND_LATEST_MODEL_URL + f'?job_id={job_id}&timeout_s=120'
 
     if start_date:
@@ -315,8 +306,8 @@ async def metrics_job_and_latest_model(job_id: int, start_date: str=None, end_da
     if filters:
         payload = {"filters": filters}
 
-    response = requests.post(formatted_url.format(job_id), headers=headers, json=payload)
-    return response.json()
+    _, response = await request_data("POST", formatted_url.format(job_id), payload)
+    return response
 
 
 @handle_exceptions
@@ -343,16 +334,12 @@ async def metrics_model(job_id: int, model_id: str) -> GetModelMetricsResponse:
         - metrics_per_decision (Dict[str, MetricsPerDecision]): Metrics per decision type
      """
 
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
     formatted_url = METRICS_MODEL_URL + f'?job_id={job_id}'
     if model_id:
         formatted_url += f'&model_id={model_id}'
 
-    response = requests.get(formatted_url.format(job_id), headers=headers)
-    return response.json()
+    _, response = await request_data("GET", formatted_url.format(job_id))
+    return response
 
 
 @handle_exceptions
@@ -370,13 +357,9 @@ async def metrics_model_request_recompute_metrics(job_id: int, model_id: str) ->
     str - A string containing the action status
     """
 
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
     formatted_url = METRICS_MODEL_URL_REQUEST_RECOMPUTE_METRICS + f'?job_id={job_id}'
     if model_id:
         formatted_url += f'&model_id={model_id}'
 
-    response = requests.post(formatted_url.format(job_id), headers=headers)
-    return response.json()
+    _, response = await request_data("POST", formatted_url.format(job_id))
+    return response
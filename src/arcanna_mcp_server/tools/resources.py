@@ -1,11 +1,10 @@
 from typing import Callable, Dict, List, Optional, Literal, Union
-from arcanna_mcp_server.environment import MANAGEMENT_API_KEY
 from arcanna_mcp_server.constants import INTEGRATION_PARAMETERS_SCHEMA_URL, RESOURCES_CRUD_URL
 from arcanna_mcp_server.models.base_resource import BaseResource
 from arcanna_mcp_server.models.resource_type import ResourceType
 from arcanna_mcp_server.utils.exceptions_handler import handle_exceptions
+from arcanna_mcp_server.utils.request_data import request_data
 from arcanna_mcp_server.utils.tool_scopes import requires_scope
-import requests
 
 
 def export_tools() -> List[Callable]:
@@ -32,11 +31,6 @@ async def integration_parameters_schema(integration_type: Optional[str] = None,
         job_resource.pipeline_integrations.parameters path. Expected parameters must be specified depending
         on job_resource.pipeline_integrations.role value.
     """
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
-
     params = {}
 
     if integration_type:
@@ -45,8 +39,8 @@ async def integration_parameters_schema(integration_type: Optional[str] = None,
     if role:
         params["role"] = role
 
-    response = requests.get(INTEGRATION_PARAMETERS_SCHEMA_URL, headers=headers, params=params)
-    return response.json()
+    _, response = await request_data("GET", INTEGRATION_PARAMETERS_SCHEMA_URL, params=params)
+    return response
 
 
 @handle_exceptions
@@ -380,17 +374,11 @@ async def upsert_resources(resources: Dict[str, BaseResource], overwrite: Option
             "resources": resources
         }
 
-        headers = {
-            "x-arcanna-api-key": MANAGEMENT_API_KEY,
-            "Content-Type": "application/json"
-        }
-
         params = {
             "overwrite": overwrite
         }
 
-        response = requests.post(RESOURCES_CRUD_URL, json=body, headers=headers, params=params)
-        response_json = response.json()
+        _, response_json = await request_data("POST", RESOURCES_CRUD_URL, body, params=params)
     except Exception as e:
         return {"error": str(e)}
     return response_json
@@ -415,11 +403,6 @@ async def get_resources(
         id : str
             The arcanna internal id of the searched resource (mutually exclusive with title)
     """
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
-
     params = {}
 
     if resource_type:
@@ -430,8 +413,8 @@ async def get_resources(
     elif id:
         params["id"] = str(id)
 
-    response = requests.get(RESOURCES_CRUD_URL, headers=headers, params=params)
-    return response.json()
+    _, response = await request_data("GET", RESOURCES_CRUD_URL, params=params)
+    return response
 
 
 @requires_scope('delete:resources')
@@ -451,11 +434,6 @@ async def delete_resources(
         id : str
             The arcanna internal id the resource that will be deleted (mutually exclusive with title)
     """
-    headers = {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json"
-    }
-
     params = {
         "resource_type": resource_type
     }
@@ -465,5 +443,5 @@ async def delete_resources(
     elif id:
         params["id"] = str(id)
 
-    response = requests.delete(RESOURCES_CRUD_URL, headers=headers, params=params)
-    return response.json()
+    _, response = await request_data("DELETE", RESOURCES_CRUD_URL, params=params)
+    return response
@@ -1,10 +1,9 @@
 from typing import Any, Callable, Dict, List, Optional, Literal, Union
 
-from arcanna_mcp_server.environment import MANAGEMENT_API_KEY
 from arcanna_mcp_server.constants import RESOURCES_CRUD_URL, INTEGRATION_METADATA_URL, JOB_METADATA_URL
 from arcanna_mcp_server.utils.exceptions_handler import handle_exceptions
+from arcanna_mcp_server.utils.request_data import request_data
 from arcanna_mcp_server.utils.tool_scopes import requires_scope
-import requests
 
 
 def export_tools() -> List[Callable]:
@@ -21,14 +20,7 @@ def export_tools() -> List[Callable]:
     ]
 
 
-def _api_headers() -> Dict[str, str]:
-    return {
-        "x-arcanna-api-key": MANAGEMENT_API_KEY,
-        "Content-Type": "application/json",
-    }
-
-
-def _fetch_resources(resource_type: str = None, title: str = None, resource_id: Union[str, int] = None):
+async def _fetch_resources(resource_type: str = None, title: str = None, resource_id: Union[str, int] = None):
     params = {}
     if resource_type:
         params["resource_type"] = resource_type
@@ -36,18 +28,18 @@ def _fetch_resources(resource_type: str = None, title: str = None, resource_id:
         params["title"] = title
     elif resource_id is not None:
         params["id"] = str(resource_id)
-    response = requests.get(RESOURCES_CRUD_URL, headers=_api_headers(), params=params)
-    return response.json()
+    _, response = await request_data("GET", RESOURCES_CRUD_URL, params=params)
+    return response
 
 
-def _fetch_integration_metadata(integration_type: str = None, role: str = None) -> Dict:
+async def _fetch_integration_metadata(integration_type: str = None, role: str = None) -> Dict:
     params = {}
     if integration_type:
         params["type"] = integration_type
     if role:
         params["role"] = role
-    response = requests.get(INTEGRATION_METADATA_URL, headers=_api_headers(), params=params)
-    return response.json()
+    _, response = await request_data("GET", INTEGRATION_METADATA_URL, params=params)
+    return response
 
 
 def _build_role_mapping_from_metadata(metadata: Dict) -> Dict[int, Dict]:
@@ -100,8 +92,8 @@ async def search_integrations(
         A dict with key 'integrations' containing a list of matches.
         Each entry has: name, id, integration_type, supported_roles.
     """
-    response_data = _fetch_resources(resource_type='integration')
-    metadata = _fetch_integration_metadata()
+    response_data = await _fetch_resources(resource_type='integration')
+    metadata = await _fetch_integration_metadata()
     role_mapping = _build_role_mapping_from_metadata(metadata)
 
     results = []
@@ -154,7 +146,7 @@ async def get_integration_details(
     if not title and id is None:
         return {"error": "Either 'title' or 'id' must be provided."}
 
-    response_data = _fetch_resources(resource_type='integration', title=title, resource_id=id)
+    response_data = await _fetch_resources(resource_type='integration', title=title, resource_id=id)
     if not response_data:
         return {"error": "Integration not found"}
     if len(response_data) == 1:
@@ -196,7 +188,7 @@ async def search_jobs(
         decision_points (list of job decision point field paths), and
         flow (list of pipeline integration entries with integration_id, title, role).
     """
-    response_data = _fetch_resources(resource_type='job')
+    response_data = await _fetch_resources(resource_type='job')
     jobs = [v.get("properties", {}) for item in response_data for v in item.values() if v.get("type") == "job"]
         
 
@@ -259,7 +251,7 @@ async def get_job_details(
     if not title and id is None:
         return {"error": "Either 'title' or 'id' must be provided."}
 
-    response_data = _fetch_resources(resource_type='job', title=title, resource_id=id)
+    response_data = await _fetch_resources(resource_type='job', title=title, resource_id=id)
     jobs = [v.get("properties", {}) for item in response_data for v in item.values() if v.get("type") == "job"]
     if not jobs:
         return {"error": "Job not found"}
@@ -297,7 +289,7 @@ async def list_integration_types(
         roles_details (role descriptions), pipeline_role_identifiers (internal keys
         to use when configuring pipeline_integrations in a job).
     """
-    return _fetch_integration_metadata(role=role)
+    return await _fetch_integration_metadata(role=role)
 
 
 @handle_exceptions
@@ -330,7 +322,7 @@ async def get_integration_type_metadata(
     if not integration_type:
         return {"error": "'integration_type' must be provided. Use list_integration_types() to discover available names."}
 
-    return _fetch_integration_metadata(integration_type=integration_type, role=role)
+    return await _fetch_integration_metadata(integration_type=integration_type, role=role)
 
 
 # ---------------------------------------------------------------------------
@@ -338,12 +330,12 @@ async def get_integration_type_metadata(
 # ---------------------------------------------------------------------------
 
 
-def _fetch_job_metadata(category: str = None) -> Dict:
+async def _fetch_job_metadata(category: str = None) -> Dict:
     params = {}
     if category:
         params["category"] = category
-    response = requests.get(JOB_METADATA_URL, headers=_api_headers(), params=params)
-    return response.json()
+    _, response = await request_data("GET", JOB_METADATA_URL, params=params)
+    return response
 
 
 @handle_exceptions
@@ -380,7 +372,7 @@ async def get_job_category_metadata(
         where 'parameters' is a dict keyed by parameter name, each value
         describing type, required, description, and any defaults or schema.
     """
-    return _fetch_job_metadata(category=category)
+    return await _fetch_job_metadata(category=category)
 
 
 # ---------------------------------------------------------------------------
@@ -437,13 +429,13 @@ async def setup_integration(
         }
     }
 
-    response = requests.post(
+    _, response = await request_data(
+        "POST",
         RESOURCES_CRUD_URL,
-        json=body,
-        headers=_api_headers(),
+        body,
         params={"overwrite": overwrite},
     )
-    return response.json()
+    return response
 
 
 # ---------------------------------------------------------------------------
@@ -576,10 +568,10 @@ async def setup_job(
         }
     }
 
-    response = requests.post(
+    _, response = await request_data(
+        "POST",
         RESOURCES_CRUD_URL,
-        json=body,
-        headers=_api_headers(),
+        body,
         params={"overwrite": overwrite},
     )
-    return response.json()
+    return response
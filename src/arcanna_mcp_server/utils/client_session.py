@@ -0,0 +1,59 @@
+from contextlib import asynccontextmanager
+
+import aiohttp
+
+from arcanna_mcp_server.environment import MANAGEMENT_API_KEY
+
+
+# Bounds concurrent requests to each Arcanna host; further requests wait for a free connection
+MAX_CONNECTIONS_PER_HOST = 16
+# No total: it would also count time queued for a pooled connection under the per-host limit.
+# sock_read stays above the longest server-side budget a tool requests (timeout_s=120 for job metrics).
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=180)
+# For endpoints that send nothing until a synchronous run completes, e.g. agentic workflow runs and code execution.
+# Generous, but still bounded so a stalled host cannot block the tool call forever.
+LONG_RUNNING_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=900)
+
+# Sent with every request to the Arcanna hosts
+DEFAULT_HEADERS = {
+    "x-arcanna-api-key": MANAGEMENT_API_KEY,
+    "Content-Type": "application/json"
+}
+
+_client_session = None
+_active_lifespans = 0
+
+
+def get_client_session() -> aiohttp.ClientSession:
+    """
+    Shared session so requests to the Arcanna hosts reuse pooled keep-alive connections.
+    """
+    global _client_session
+    if _client_session is None or _client_session.closed:
+        connector = aiohttp.TCPConnector(limit_per_host=MAX_CONNECTIONS_PER_HOST)
+        _client_session = aiohttp.ClientSession(connector=connector, headers=DEFAULT_HEADERS,
+                                                timeout=REQUEST_TIMEOUT)
+    return _client_session
+
+
+async def close_client_session():
+    global _client_session
+    client_session, _client_session = _client_session, None
+    if client_session is not None and not client_session.closed:
+        await client_session.close()
+
+
+@asynccontextmanager
+async def client_session_lifespan(_server):
+    """
+    FastMCP lifespan closing the shared session on shutdown. With SSE the lifespan is entered once per client
+    connection, so the session is only closed when the last one ends.
+    """
+    global _active_lifespans
+    _active_lifespans += 1
+    try:
+        yield
+    finally:
+        _active_lifespans -= 1
+        if _active_lifespans == 0:
+            await close_client_session()
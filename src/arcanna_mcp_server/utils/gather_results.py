@@ -0,0 +1,12 @@
+import asyncio
+
+from arcanna_mcp_server.utils.exceptions_handler import exception_response
+
+
+async def gather_results(coros) -> list:
+    """
+    Runs the coroutines concurrently and returns their results in order, with failed ones replaced by
+    the same error response handle_exceptions gives, so one failure does not fail the whole batch.
+    """
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    return [exception_response(result) if isinstance(result, BaseException) else result for result in results]
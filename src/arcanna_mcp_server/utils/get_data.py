@@ -1,8 +1,7 @@
-import aiohttp
+from arcanna_mcp_server.utils.request_data import send_request
 
 
-async def get_data(url, req_headers):
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=req_headers) as server_response:
-            server_response.raise_for_status()
-            return await server_response.json()
+async def get_data(url):
+    async with send_request("GET", url) as server_response:
+        server_response.raise_for_status()
+        return await server_response.json()
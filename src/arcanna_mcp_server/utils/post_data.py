@@ -1,7 +1,6 @@
-import aiohttp
+from arcanna_mcp_server.utils.client_session import REQUEST_TIMEOUT
+from arcanna_mcp_server.utils.request_data import request_data
 
 
-async def post_data(url, req_headers, data):
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=req_headers, json=data) as server_response:
-            return server_response.status, await server_response.json()
+async def post_data(url, data, timeout=REQUEST_TIMEOUT):
+    return await request_data("POST", url, data, timeout=timeout)
@@ -0,0 +1,76 @@
+import asyncio
+import random
+from contextlib import asynccontextmanager
+from enum import Enum
+
+import aiohttp
+
+from arcanna_mcp_server.utils.client_session import REQUEST_TIMEOUT, get_client_session
+
+
+# Only idempotent methods are retried on error statuses or dropped keep-alive connections; POSTs here
+# ingest events or trigger job actions. Failed or timed out connection attempts are retried for every method
+# since the request never reached the server. TLS errors are never retried as they cannot succeed on retry.
+RETRY_METHODS = frozenset({"GET", "PUT", "DELETE"})
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 0.5
+RETRY_JITTER_SECONDS = 0.5
+
+
+def _query_value(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, bool):
+        return str(value)
+    return value
+
+
+def _query_params(params):
+    """
+    Encode query params the way requests did: None values are dropped, booleans sent as True/False
+    and enums by value.
+    """
+    if not params:
+        return None
+    return {key: _query_value(value) for key, value in params.items() if value is not None}
+
+
+def _retry_delay(attempt):
+    return RETRY_BACKOFF_SECONDS * 2 ** attempt + random.uniform(0, RETRY_JITTER_SECONDS)
+
+
+@asynccontextmanager
+async def send_request(method, url, data=None, params=None, timeout=REQUEST_TIMEOUT, retry=True):
+    """
+    Yields the server response, retrying transient failures with exponential backoff and jitter.
+    With retry=False the first response or error is returned as is.
+    """
+    session = get_client_session()
+    max_retries = MAX_RETRIES if retry else 0
+    for attempt in range(max_retries + 1):
+        is_last_attempt = attempt == max_retries
+        try:
+            server_response = await session.request(method, url, json=data,
+                                                     params=_query_params(params), timeout=timeout)
+        except aiohttp.ClientSSLError:
+            raise
+        except (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError):
+            if is_last_attempt:
+                raise
+        except aiohttp.ServerDisconnectedError:
+            if is_last_attempt or method not in RETRY_METHODS:
+                raise
+        else:
+            if (is_last_attempt or method not in RETRY_METHODS
+                    or server_response.status not in RETRY_STATUS_CODES):
+                async with server_response:
+                    yield server_response
+                return
+            server_response.release()
+        await asyncio.sleep(_retry_delay(attempt))
+
+
+async def request_data(method, url, data=None, params=None, timeout=REQUEST_TIMEOUT, retry=True):
+    async with send_request(method, url, data, params, timeout, retry) as server_response:
+        return server_response.status, await server_response.json(content_type=None)
@@ -6,6 +6,9 @@ from arcanna_mcp_server.environment import MANAGEMENT_API_KEY
 
 logger = logging.getLogger(__name__)
 
+# (connect, read) timeout for the startup scope lookup, so an unreachable host fails startup instead of hanging it
+SCOPE_REQUEST_TIMEOUT = (10, 30)
+
 
 def requires_scope(*scope):
     def decorator(func):
@@ -25,7 +28,8 @@ def get_api_key_scope() -> set:
     headers = {"x-arcanna-api-key": MANAGEMENT_API_KEY}
     response = requests.get(
         GET_TOKEN_SCOPE_URL,
-        headers=headers
+        headers=headers,
+        timeout=SCOPE_REQUEST_TIMEOUT
     )
     json_response = response.json()
 
@@ -52,7 +56,7 @@ def filter_by_scope(callables_list):
             filtered_callables_list.append(func)
             continue
 
-        if not set(func.required_scope).issubset(api_key_scope):
+        if not api_key_scope.issuperset(func.required_scope):
             logger.warning(f"Function {func.__name__} requires scope {func.required_scope}")
             continue
 